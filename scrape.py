@@ -5,17 +5,86 @@ This API provides access to Pasig City government documents including resolution
 ordinances, executive orders, and bids & awards information.
 """
 
-from fastapi import FastAPI, HTTPException, Query, Path
-from typing import Optional, List, Dict, Any
-from bs4 import BeautifulSoup
-from utils import get_current_year, update_if_needed, get_time
+from fastapi import FastAPI, HTTPException, Query, Path, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import Optional, List, Dict, Any, Tuple
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from selectolax.lexbor import LexborHTMLParser
+from utils import get_current_year, refresh_all, get_time, close_http_client, html_cache_path, read_cached_html
+import asyncio
+import base64
+import hashlib
+import json
 import os
+import pickle
+import re
+import threading
+
+# pyarrow is optional: when available, query filtering runs through its
+# vectorized C++ substring kernel instead of a per-row Python loop.
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+
+# How often the background refresher re-checks whether the cached HTML files
+# are older than the refresh window (the refresh itself is daily)
+REFRESH_CHECK_INTERVAL_SECONDS = 3600
+
+
+async def _refresh_loop() -> None:
+    """
+    Periodically refresh every cached HTML file, off the request path.
+
+    All four paths refresh concurrently through the shared async HTTP
+    client, so a full cycle takes about as long as the slowest fetch. A
+    failed refresh keeps the last good cache and is retried on the next
+    cycle.
+    """
+    while True:
+        failures = await refresh_all()
+        for path, error in failures.items():
+            print(f"Background refresh failed for '{path}': {error}")
+
+        # Re-extract eagerly (in a worker thread) so the first request after
+        # a refresh finds warm caches and a fresh pickle instead of paying
+        # the parse itself; unchanged files make these near-instant no-ops
+        try:
+            for path in VALID_PATHS:
+                if html_cache_path(path) is not None:
+                    await asyncio.to_thread(_load_document_rows, path)
+            if html_cache_path("bids-and-awards") is not None:
+                await asyncio.to_thread(_load_bids_rows, "invitation-to-bid")
+        except Exception as error:
+            print(f"Background re-extraction failed: {error}")
+
+        await asyncio.sleep(REFRESH_CHECK_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start the background refresher on startup; cancel it and close the shared
+    HTTP client on shutdown.
+    """
+    refresh_task = asyncio.create_task(_refresh_loop())
+    yield
+    refresh_task.cancel()
+    await close_http_client()
 
 
 app = FastAPI(
     title = "Pasig Full Disclosure API",
     description = "API for accessing Pasig City government transparency documents",
-    version = "1.0.0"
+    version = "1.0.0",
+    lifespan = lifespan,
+    # Serialize responses with orjson (C implementation), which matters for
+    # pages of up to 1000 row dicts now that parsing is cached
+    default_response_class = ORJSONResponse
 )
 
 
@@ -54,6 +123,518 @@ path_to_title: Dict[str, str] = {
 }
 
 
+# In-process cache of fully-extracted rows, keyed by data path (with all
+# bids-and-awards categories under one key). Each entry stores the mtime of the
+# HTML file it was parsed from, so the cache invalidates itself whenever
+# refresh_html replaces the file.
+_PARSE_CACHE: Dict[str, Tuple[float, Any]] = {}
+_PARSE_LOCK = threading.Lock()
+
+
+def _pickle_path(path: str) -> str:
+    """
+    Return the sidecar file holding the pickled extraction for a data path.
+    """
+    return os.path.join("htmls", f"{path}.pkl")
+
+
+def _load_pickled_rows(path: str, mtime: float) -> Optional[Any]:
+    """
+    Load the persisted extraction for a path, or None when it is missing,
+    unreadable, or was built from a different version of the HTML file.
+    """
+    try:
+        with open(_pickle_path(path), "rb") as f:
+            stored_mtime, payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    return payload if stored_mtime == mtime else None
+
+
+def _store_pickled_rows(path: str, mtime: float, payload: Any) -> None:
+    """
+    Persist an extraction next to its HTML file, tagged with the file's mtime
+    so a stale pickle is never served. Written atomically, and best-effort: a
+    failure here only costs a re-parse on the next process start.
+    """
+    filename = _pickle_path(path)
+    tmp_filename = f"{filename}.tmp"
+    try:
+        with open(tmp_filename, "wb") as f:
+            pickle.dump((mtime, payload), f, protocol = 5)
+        os.replace(tmp_filename, filename)
+    except OSError:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+
+# Strict four-digit year, so e.g. "12001" in a header never matches as 2001
+_YEAR_PATTERN = re.compile(r"\b(?:19|20)\d{2}\b")
+
+
+def _build_titles_array(lowers: List[str]) -> Optional[Any]:
+    """
+    Build a pyarrow string array from casefolded titles, or None when
+    pyarrow is not installed.
+    """
+    if pa is None:
+        return None
+    return pa.array(lowers, type = pa.string())
+
+
+def _match_indices(
+    lowers: List[str],
+    titles_arr: Optional[Any],
+    q: str
+) -> List[int]:
+    """
+    Return the indices of the titles that contain the casefolded query.
+
+    Uses pyarrow's match_substring kernel (a single SIMD C++ scan over the
+    whole title column) when available, falling back to a Python loop over
+    the precomputed lowercase titles otherwise. Producing indices rather
+    than rows lets callers slice the page window before materializing any
+    result rows.
+
+    Args:
+        lowers: Casefolded titles, parallel to the cached rows.
+        titles_arr: Optional pyarrow string array of the same titles.
+        q: The casefolded search query.
+
+    Returns:
+        The matching indices, in ascending order.
+    """
+    if titles_arr is not None:
+        mask = pc.match_substring(titles_arr, q)
+        return pc.indices_nonzero(mask).to_pylist()
+    return [i for i, t in enumerate(lowers) if q in t]
+
+
+def _query_hash(query: Optional[str]) -> str:
+    """
+    Return a short stable hash of the query, used to tie a cursor to the
+    query it was issued for.
+    """
+    return hashlib.blake2b((query or "").encode("utf-8"), digest_size = 8).hexdigest()
+
+
+def _encode_cursor(payload: Dict[str, Any]) -> str:
+    """
+    Encode a cursor payload as an opaque URL-safe base64 string.
+    """
+    raw = json.dumps(payload, separators = (",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str, query: Optional[str]) -> Dict[str, Any]:
+    """
+    Decode and validate an opaque cursor string.
+
+    Args:
+        cursor: The cursor value supplied by the client.
+        query: The query parameter of the current request, which must match
+               the query the cursor was issued for.
+
+    Returns:
+        The decoded cursor payload.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or was issued for a
+                       different query.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code = 400,
+            detail = "Invalid cursor"
+        )
+    if not isinstance(payload, dict) or payload.get("q") != _query_hash(query):
+        raise HTTPException(
+            status_code = 400,
+            detail = "Cursor does not match this query"
+        )
+    # The resume position must be integral; anything else would surface as a
+    # comparison TypeError (a 500) deep inside pagination
+    for key in ("y", "i"):
+        if key in payload and not isinstance(payload[key], int):
+            raise HTTPException(
+                status_code = 400,
+                detail = "Invalid cursor"
+            )
+    return payload
+
+
+def _response_etag(html_file: str, *key_parts: Any) -> str:
+    """
+    Compute an ETag for a response from the cached HTML file's mtime and the
+    other parts that shape the result (the last_updated stamp and the request
+    parameters).
+
+    The mtime changes whenever the data is refreshed, so a stored ETag stays
+    valid exactly as long as the response it was issued for; callers also pass
+    the path's last_updated stamp, since the body embeds it even when a
+    refresh leaves the HTML (and thus the mtime) untouched.
+    """
+    key = ":".join(str(part) for part in (os.path.getmtime(html_file),) + key_parts)
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size = 16).hexdigest()
+    return f'"{digest}"'
+
+
+def _load_document_rows(path: str) -> Dict[str, Any]:
+    """
+    Return the fully-extracted rows for a document path, parsing at most once
+    per HTML refresh.
+
+    Rows are materialized as {year, title, link, uuid, views} dicts with no
+    query or pagination applied, indexed by year so the endpoint can look up
+    each requested year in O(1). A parallel index of casefolded titles is
+    precomputed so query filtering never re-normalizes per request. The result
+    is cached in-process keyed by the HTML file's mtime; steady-state requests
+    never touch the parser. Refreshing the HTML itself is the background
+    refresher's job, so this never performs network I/O.
+
+    Args:
+        path: The data path (e.g., 'resolutions', 'ordinances', 'executive-orders').
+
+    Returns:
+        A dict with 'by_year' ({year: [row, ...]}), 'titles_lower'
+        ({year: [str, ...]} of casefolded titles, parallel to 'by_year') and 'titles_arr'
+        ({year: pyarrow array or None}, parallel to 'by_year').
+    """
+    html_file = html_cache_path(path)
+    mtime = os.path.getmtime(html_file)
+
+    with _PARSE_LOCK:
+        cached = _PARSE_CACHE.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    # A pickled extraction from a previous process (or the background
+    # refresher) skips the HTML parse entirely; only the pyarrow index is
+    # rebuilt, since it is cheap and keeps the pickle backend-agnostic
+    payload = _load_pickled_rows(path, mtime)
+    if payload is not None:
+        by_year, titles_lower = payload
+        data = {
+            "by_year": by_year,
+            "titles_lower": titles_lower,
+            "titles_arr": {year: _build_titles_array(lowers) for year, lowers in titles_lower.items()},
+        }
+        with _PARSE_LOCK:
+            _PARSE_CACHE[path] = (mtime, data)
+        return data
+
+    tree = LexborHTMLParser(read_cached_html(html_file))
+
+    headers = tree.css("div.card-header")
+    by_year: Dict[int, List[Dict[str, Any]]] = {}
+    titles_lower: Dict[int, List[str]] = {}
+    titles_arr: Dict[int, Optional[Any]] = {}
+
+    # One pass over the headers, reading the year out of each h2, instead of
+    # rescanning every header once per candidate year
+    for header in headers:
+        h2 = header.css_first('h2')
+        year_match = _YEAR_PATTERN.search(h2.text() if h2 is not None else "")
+        if year_match is None:
+            continue  # Skip headers without a recognizable year
+        year = int(year_match.group(0))
+        if year in by_year:
+            continue  # First header for a year wins, as before
+
+        # The rows live in a table that is a sibling of the header inside the same card
+        all_trs = header.parent.css('table tr')
+
+        rows = []
+        lowers = []
+
+        # Process rows for this year
+        for tr in all_trs:
+            a_tag = tr.css_first('a')
+            if not a_tag:  # Skip if no 'a' tag
+                continue
+
+            # Extract row data (all C-level node methods, no re-parsing needed);
+            # .attributes builds a fresh dict per access, so read it once
+            title = a_tag.text(strip = True)
+            attrs = a_tag.attributes
+            tds = tr.css('td')
+            rows.append({
+                'year': year,
+                'title': title,
+                'link': attrs.get('href'),
+                'uuid': attrs.get('data-uuid'),
+                'views': tds[1].text(strip = True) if len(tds) > 1 else None,
+            })
+            lowers.append(title.casefold())
+
+        if rows:
+            by_year[year] = rows
+            titles_lower[year] = lowers
+            titles_arr[year] = _build_titles_array(lowers)
+
+    data = {"by_year": by_year, "titles_lower": titles_lower, "titles_arr": titles_arr}
+    with _PARSE_LOCK:
+        _PARSE_CACHE[path] = (mtime, data)
+    _store_pickled_rows(path, mtime, (by_year, titles_lower))
+    return data
+
+
+def _load_bids_rows(category: str) -> Tuple[List[Dict[str, Any]], List[str], Optional[Any]]:
+    """
+    Return the fully-extracted rows for a bids-and-awards category, parsing at
+    most once per HTML refresh.
+
+    Same caching scheme as _load_document_rows, but all nine categories come
+    out of a single shared HTML file, so one pass over the section headers
+    extracts every category at once instead of re-parsing the file per
+    category. Titles are casefolded once at load time for query filtering.
+
+    Args:
+        category: A key of path_to_title (e.g., 'notice-of-awards').
+
+    Returns:
+        A tuple of ({title, link, uuid, views} row dicts, parallel list of
+        casefolded titles, parallel pyarrow array or None).
+    """
+    html_file = html_cache_path("bids-and-awards")
+    mtime = os.path.getmtime(html_file)
+    cache_key = "bids-and-awards"
+    empty_entry = ([], [], None)
+
+    with _PARSE_LOCK:
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1].get(category, empty_entry)
+
+    # Same pickle fast path as _load_document_rows: load rows extracted by a
+    # previous process and rebuild only the pyarrow index
+    payload = _load_pickled_rows(cache_key, mtime)
+    if payload is not None:
+        category_index = {
+            cat: (rows, lowers, _build_titles_array(lowers))
+            for cat, (rows, lowers) in payload.items()
+        }
+        with _PARSE_LOCK:
+            _PARSE_CACHE[cache_key] = (mtime, category_index)
+        return category_index.get(category, empty_entry)
+
+    tree = LexborHTMLParser(read_cached_html(html_file))
+
+    # Map section headers back to category slugs so one header walk fills
+    # the whole index
+    title_to_category = {title: cat for cat, title in path_to_title.items()}
+    category_index: Dict[str, Tuple[List[Dict[str, Any]], List[str], Optional[Any]]] = {}
+
+    for header in tree.css("div.col-md-12.text-center"):
+        h1 = header.css_first('h1')
+        if h1 is None:
+            continue
+        cat = title_to_category.get(h1.text(strip = True))
+        if cat is None or cat in category_index:
+            continue  # Unknown section, or first header for a category wins
+
+        # The rows live in a sibling column inside the same row container
+        tag_to_use = 'li' if cat == 'other-notices' else 'tr'
+        all_rows = []
+        all_lowers = []
+        for tr in header.parent.css(tag_to_use):
+            a_tag = tr.css_first('a')
+            if not a_tag:  # Skip if no 'a' tag
+                continue
+
+            # Extract row data (all C-level node methods, no re-parsing needed);
+            # .attributes builds a fresh dict per access, so read it once
+            row_title = a_tag.text(strip = True)
+            attrs = a_tag.attributes
+            tds = tr.css('td')
+            all_rows.append({
+                'title': row_title,
+                'link': attrs.get('href'),
+                'uuid': attrs.get('data-uuid'),
+                'views': tds[1].text(strip = True) if len(tds) > 1 else None,
+            })
+            all_lowers.append(row_title.casefold())
+
+        category_index[cat] = (all_rows, all_lowers, _build_titles_array(all_lowers))
+
+    with _PARSE_LOCK:
+        _PARSE_CACHE[cache_key] = (mtime, category_index)
+    _store_pickled_rows(cache_key, mtime, {
+        cat: (rows, lowers) for cat, (rows, lowers, arr) in category_index.items()
+    })
+    return category_index.get(category, empty_entry)
+
+
+def _paginate_buckets(
+    buckets: List[Tuple[int, List[Dict[str, str]], List[str], Any]],
+    query: Optional[str],
+    skip: int,
+    top: int,
+    cursor: Optional[str]
+) -> Tuple[int, List[Dict[str, str]], Optional[str]]:
+    """
+    Shared pagination engine for both endpoint builders.
+
+    buckets is an ordered list of (key, rows, titles_lower, titles_arr)
+    tuples -- one bucket per year for documents, a single bucket for a bids
+    category. Counts matches and materializes only the rows inside the page
+    window, resuming from the (bucket key, row index) cursor position in O(1)
+    when a cursor is given. Returns (num_results, page_rows, next_cursor).
+    """
+    q = query.casefold() if query is not None else None
+
+    # Cursor mode resumes right after the (bucket, row index) of the last
+    # returned row; offset mode counts matches up to skip
+    if cursor is not None:
+        payload = _decode_cursor(cursor, query)
+        resume_key = payload.get("y", buckets[0][0] if buckets else 0)
+        resume_index = payload.get("i", -1)
+    else:
+        resume_key = None
+        resume_index = None
+
+    total_count = 0
+    consumed = 0  # Matches at or before the last returned row
+    paginated_results = []
+    last_pos: Optional[Tuple[int, int]] = None  # (bucket key, row index) of last returned row
+    for key, rows, lowers, arr in buckets:
+        if q is None:
+            indices = None
+            matches = len(rows)
+        else:
+            # Filter against the precomputed (vectorized) title index
+            indices = _match_indices(lowers, arr, q)
+            matches = len(indices)
+        total_count += matches
+
+        if cursor is not None:
+            # Resume from the cursor position in O(1) per bucket
+            if key < resume_key:
+                consumed += matches
+                continue
+            need = top - len(paginated_results)
+            if need <= 0:
+                continue  # Page is full; keep counting the total
+            if q is None:
+                start = resume_index + 1 if key == resume_key else 0
+                start = min(start, matches)
+                consumed += start
+                taken = rows[start:start + need]
+                if taken:
+                    last_pos = (key, start + len(taken) - 1)
+            else:
+                positions = [i for i in indices if i > resume_index] if key == resume_key else indices
+                consumed += matches - len(positions)
+                taken_idx = positions[:need]
+                taken = [rows[i] for i in taken_idx]
+                if taken_idx:
+                    last_pos = (key, taken_idx[-1])
+            paginated_results.extend(taken)
+            consumed += len(taken)
+        else:
+            # Overlap of this bucket's matches with the [skip, skip + top) window
+            lo = max(skip - (total_count - matches), 0)
+            hi = min(skip + top - (total_count - matches), matches)
+            if lo < hi:
+                if q is None:
+                    paginated_results.extend(rows[lo:hi])
+                    last_pos = (key, hi - 1)
+                else:
+                    paginated_results.extend(rows[i] for i in indices[lo:hi])
+                    last_pos = (key, indices[hi - 1])
+
+    if cursor is None:
+        consumed = min(skip, total_count) + len(paginated_results)
+
+    # Emit a cursor for the next page when more matches remain
+    if last_pos is not None and consumed < total_count:
+        next_cursor = _encode_cursor({"y": last_pos[0], "i": last_pos[1], "q": _query_hash(query)})
+    else:
+        next_cursor = None
+
+    return total_count, paginated_results, next_cursor
+
+
+@lru_cache(maxsize = 1024)
+def _build_document_response(
+    mtime: float,
+    path: str,
+    start_year: int,
+    end_year: int,
+    query: Optional[str],
+    skip: int,
+    top: int,
+    cursor: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Build the response body for get_data, memoized on its arguments.
+
+    mtime is the cached HTML file's mtime; it is not used directly, but keying
+    the cache on it invalidates every memoized response automatically when the
+    underlying data refreshes. last_updated is intentionally left out and
+    added by the endpoint, so a timestamp bump without a content change never
+    serves a stale value.
+    """
+    data = _load_document_rows(path)
+    by_year = data["by_year"]
+
+    # One bucket per year inside the requested range, in ascending order
+    buckets = [
+        (year, by_year[year], data["titles_lower"][year], data["titles_arr"][year])
+        for year in range(start_year, end_year + 1)
+        if by_year.get(year)
+    ]
+    total_count, paginated_results, next_cursor = _paginate_buckets(buckets, query, skip, top, cursor)
+
+    return {
+        "num_results": total_count,
+        "skip": skip,
+        "top": top,
+        "returned_results": len(paginated_results),
+        "next_cursor": next_cursor,
+        "results": paginated_results,
+    }
+
+
+@lru_cache(maxsize = 1024)
+def _build_bids_response(
+    mtime: float,
+    category: str,
+    query: Optional[str],
+    skip: int,
+    top: int,
+    cursor: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Build the response body for get_bids_and_awards, memoized on its arguments.
+
+    Same memoization scheme as _build_document_response: the mtime key
+    invalidates cached responses on refresh, and last_updated is added by
+    the endpoint.
+    """
+    all_rows, titles_lower, titles_arr = _load_bids_rows(category)
+
+    if not all_rows:
+        raise HTTPException(
+            status_code = 404,
+            detail = f"No data found for category '{category}'"
+        )
+
+    # Bids categories are a flat list, so they paginate as a single bucket
+    buckets = [(0, all_rows, titles_lower, titles_arr)]
+    total_count, paginated_results, next_cursor = _paginate_buckets(buckets, query, skip, top, cursor)
+
+    return {
+        "num_results": total_count,
+        "skip": skip,
+        "top": top,
+        "returned_results": len(paginated_results),
+        "next_cursor": next_cursor,
+        "category": category,
+        "results": paginated_results,
+    }
+
 @app.get(
     "/{path}",
     summary = "Get documents by path and year range",
@@ -92,18 +673,22 @@ path_to_title: Dict[str, str] = {
     }
 )
 async def get_data(
+    request: Request,
+    response: Response,
     path: str = Path(..., description = "Document type (resolutions, ordinances, executive-orders)", example = "resolutions"),
     start_year: Optional[int] = Query(2000, ge = 2000, le = 2100, description = "Starting year for document search", example = 2023),
     end_year: Optional[int] = Query(None, ge = 2000, le = 2100, description = "Ending year for document search (defaults to current year)", example = 2024),
     query: Optional[str] = Query(None, description = "Search query to filter documents by title", example = "Rosario"),
     skip: Optional[int] = Query(0, ge = 0, description = "Number of results to skip for pagination", example = 0),
-    top: Optional[int] = Query(500, ge = 1, le = 1000, description = "Maximum number of results to return", example = 10)
+    top: Optional[int] = Query(500, ge = 1, le = 1000, description = "Maximum number of results to return", example = 10),
+    cursor: Optional[str] = Query(None, description = "Opaque cursor from a previous response's next_cursor; resumes after the last returned row and takes precedence over skip")
 ) -> Dict[str, Any]:
     """
     Retrieve documents by path (resolutions, ordinances, executive-orders) with optional filtering.
-    
-    Returns paginated results with metadata including total count, allowing clients to
-    implement pagination by adjusting skip and top parameters.
+
+    Returns paginated results with metadata including total count. Clients can paginate
+    either by adjusting skip and top, or (preferred for deep pages) by following the
+    next_cursor value, which resumes in O(1) instead of rescanning skipped rows.
     """
     # Validate path
     if path not in VALID_PATHS:
@@ -123,75 +708,38 @@ async def get_data(
             detail = "start_year cannot be greater than end_year"
         )
     
-    # Check if HTML file exists
-    html_file = f"htmls/{path}.html"
-    if not os.path.exists(html_file):
+    # Check if a cached HTML copy exists
+    html_file = html_cache_path(path)
+    if html_file is None:
         raise HTTPException(
             status_code = 503,
             detail = f"Data for '{path}' is not yet available. Please try again later."
         )
-    
+
+    # The response only changes when the underlying HTML or the last_updated
+    # stamp does; answer a matching If-None-Match with an empty 304 before
+    # doing any work
+    etag = _response_etag(html_file, get_time(path), path, start_year, end_year, query, skip, top, cursor)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code = 304)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "public, max-age=3600"
+
     try:
-        update_if_needed(path)
-        with open(html_file, "r", encoding = "utf-8") as f:
-            soup = BeautifulSoup(f, "lxml")
+        # Run in a worker thread so a cache-miss parse of the HTML file does
+        # not block the event loop; cache hits return almost immediately
+        result = await asyncio.to_thread(
+            _build_document_response, os.path.getmtime(html_file), path, start_year, end_year, query, skip, top, cursor
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code = 500,
             detail = f"Error reading data: {str(e)}"
         )
-    
-    headers = soup.find_all(class_ = "card-header")
-    # Filter and extract across all years - collect ALL results first
-    all_results = []
-    
-    # Loop through years from start_year to end_year (inclusive)
-    for year in range(start_year, end_year + 1):
-        # Find the section for this year
-        year_header = [header for header in headers if str(year) in header.find('h2').string]
-        if len(year_header) == 0:
-            continue  # Skip this year if not found
-        
-        year_soup = year_header[0].next_sibling.next_sibling
-        all_trs = year_soup.find_all('tr')
-        
-        # Process rows for this year
-        for tr in all_trs:
-            a_tag = tr.find('a')
-            if not a_tag:  # Skip if no 'a' tag
-                continue
-            
-            # Extract title first to check query
-            title = a_tag.get_text(strip = True)
-            
-            # Filter by query if provided
-            if query is not None and query.lower() not in title.lower():
-                continue
-            
-            # Extract remaining data (all Tag methods, no re-parsing needed)
-            tds = tr.find_all('td')
-            data = {
-                'year': year,
-                'title': title,
-                'link': a_tag.get('href'),
-                'uuid': a_tag.get('data-uuid'),
-                'views': tds[1].get_text(strip = True) if len(tds) > 1 else None,
-            }
-            all_results.append(data)
-    
-    # Apply pagination: skip and top
-    total_count = len(all_results)
-    paginated_results = all_results[skip:skip + top]
-    
-    last_updated = get_time(path)
-    return {
-        "num_results": total_count,
-        "skip": skip,
-        "top": top,
-        "returned_results": len(paginated_results),
-        "last_updated": last_updated,
-        "results": paginated_results,
-    }
+
+    return {**result, "last_updated": get_time(path)}
 
 
 @app.get(
@@ -231,16 +779,20 @@ async def get_data(
     }
 )
 async def get_bids_and_awards(
+    request: Request,
+    response: Response,
     category: str = Path(..., description = "Category of bids/awards document", example = "notice-of-awards"),
     query: Optional[str] = Query(None, description = "Search query to filter documents by title", example = "Rosario"),
     skip: Optional[int] = Query(0, ge = 0, description = "Number of results to skip for pagination", example = 0),
-    top: Optional[int] = Query(500, ge = 1, le = 1000, description = "Maximum number of results to return", example = 10)
+    top: Optional[int] = Query(500, ge = 1, le = 1000, description = "Maximum number of results to return", example = 10),
+    cursor: Optional[str] = Query(None, description = "Opaque cursor from a previous response's next_cursor; resumes after the last returned row and takes precedence over skip")
 ) -> Dict[str, Any]:
     """
     Retrieve bids and awards documents by category with optional filtering.
-    
-    Returns paginated results with metadata including total count, allowing clients to
-    implement pagination by adjusting skip and top parameters.
+
+    Returns paginated results with metadata including total count. Clients can paginate
+    either by adjusting skip and top, or (preferred for deep pages) by following the
+    next_cursor value, which resumes in O(1) instead of rescanning skipped rows.
     """
     # Validate category
     if category not in path_to_title:
@@ -249,75 +801,35 @@ async def get_bids_and_awards(
             detail = f"Category '{category}' not found. Valid categories: {', '.join(path_to_title.keys())}"
         )
     
-    # Check if HTML file exists
-    html_file = "htmls/bids-and-awards.html"
-    if not os.path.exists(html_file):
+    # Check if a cached HTML copy exists
+    html_file = html_cache_path("bids-and-awards")
+    if html_file is None:
         raise HTTPException(
             status_code = 503,
             detail = "Bids and awards data is not yet available. Please try again later."
         )
-    
+
+    # The response only changes when the underlying HTML or the last_updated
+    # stamp does; answer a matching If-None-Match with an empty 304 before
+    # doing any work
+    etag = _response_etag(html_file, get_time("bids-and-awards"), category, query, skip, top, cursor)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code = 304)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "public, max-age=3600"
+
     try:
-        update_if_needed("bids-and-awards")
-        with open(html_file, "r", encoding = "utf-8") as f:
-            soup = BeautifulSoup(f, "lxml")
+        # Run in a worker thread so a cache-miss parse of the HTML file does
+        # not block the event loop; cache hits return almost immediately
+        result = await asyncio.to_thread(
+            _build_bids_response, os.path.getmtime(html_file), category, query, skip, top, cursor
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code = 500,
             detail = f"Error reading data: {str(e)}"
         )
-    
-    path = path_to_title[category]
-    tag_to_use = 'li' if category == 'other-notices' else 'tr'
-    headers = soup.find_all(class_ = "col-md-12 text-center")
-    
-    trs = []
-    for header in headers:
-        if header.h1 and header.h1.string == path:
-            trs = header.next_sibling.next_sibling.find_all(tag_to_use)
-            break
-    
-    if not trs:
-        raise HTTPException(
-            status_code = 404,
-            detail = f"No data found for category '{category}'"
-        )
-    
-    # Collect all results first
-    all_results = []
-    for tr in trs:
-        a_tag = tr.find('a')
-        if not a_tag:  # Skip if no 'a' tag
-            continue
-            
-        # Extract title first to check query
-        title = a_tag.get_text(strip = True)
-            
-        # Filter by query if provided
-        if query is not None and query.lower() not in title.lower():
-            continue
-            
-        # Extract remaining data (all Tag methods, no re-parsing needed)
-        tds = tr.find_all('td')
-        data = {
-            'title': title,
-            'link': a_tag.get('href'),
-            'uuid': a_tag.get('data-uuid'),
-            'views': tds[1].get_text(strip = True) if len(tds) > 1 else None,
-        }
-        all_results.append(data)
-    
-    # Apply pagination
-    total_count = len(all_results)
-    paginated_results = all_results[skip:skip + top]
 
-    last_updated = get_time("bids-and-awards")
-    return {
-        "num_results": total_count,
-        "skip": skip,
-        "top": top,
-        "returned_results": len(paginated_results),
-        "last_updated": last_updated,
-        "category": category,
-        "results": paginated_results,
-    }
\ No newline at end of file
+    return {**result, "last_updated": get_time("bids-and-awards")}
\ No newline at end of file
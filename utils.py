@@ -5,163 +5,413 @@ This module provides functions for fetching, caching, and managing HTML data
 from the Pasig City government website. All timestamps use UTC+8 (Philippine Time).
 """
 
-import requests
+import asyncio
+import gzip
+import httpx
+import json
 import os
+import threading
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict
 
 
+# UTC+8 (Philippine Time), built once instead of per call
+PH_TZ = timezone(timedelta(hours = 8))
+
 # Mapping of data paths to their corresponding URLs on the Pasig City website
 path_to_url: Dict[str, str] = {
-    "resolutions": "https://pasigcity.gov.ph/city-resolutions", 
-    "ordinances": "https://pasigcity.gov.ph/city-ordinances", 
-    "executive-orders": "https://pasigcity.gov.ph/executive-orders", 
+    "resolutions": "https://pasigcity.gov.ph/city-resolutions",
+    "ordinances": "https://pasigcity.gov.ph/city-ordinances",
+    "executive-orders": "https://pasigcity.gov.ph/executive-orders",
     "bids-and-awards": "https://pasigcity.gov.ph/bids-and-awards"
 }
 
+# Sidecar file storing the HTTP cache validators (ETag / Last-Modified) from
+# the previous fetch of each path, used for conditional GETs. The lock guards
+# the read-modify-write cycle when concurrent refreshes update their entries.
+HTTP_META_FILE = "http_meta.json"
+_HTTP_META_LOCK = threading.Lock()
+
+# Refresh timestamps are persisted as a single JSON blob and cached in memory,
+# so get_time on the request path is a dict lookup instead of a file scan.
+# The legacy line-based last_updated.txt is read once for migration.
+LAST_UPDATED_FILE = "last_updated.json"
+LEGACY_LAST_UPDATED_FILE = "last_updated.txt"
+
+_TIMES: Optional[Dict[str, str]] = None
+_TIMES_MTIME: Optional[int] = None
+_TIMES_LOCK = threading.Lock()
+
+def html_cache_path(path: str) -> Optional[str]:
+    """
+    Return the on-disk HTML cache file for a data path, or None if no copy
+    exists yet.
+
+    Freshly-downloaded pages are stored gzip-compressed as
+    'htmls/{path}.html.gz' (HTML compresses roughly 10x); a plain
+    'htmls/{path}.html' from older deployments is used as a fallback.
+
+    Args:
+        path: The data path (e.g., 'resolutions', 'bids-and-awards').
+
+    Returns:
+        The filename of the cached copy, preferring the gzip one.
+    """
+    gz_filename = os.path.join("htmls", f"{path}.html.gz")
+    if os.path.exists(gz_filename):
+        return gz_filename
+    filename = os.path.join("htmls", f"{path}.html")
+    if os.path.exists(filename):
+        return filename
+    return None
+
+
+def read_cached_html(filename: str) -> bytes:
+    """
+    Read a cached HTML file, decompressing transparently if it is gzipped.
+
+    Args:
+        filename: A filename returned by html_cache_path.
+
+    Returns:
+        The raw HTML bytes.
+    """
+    if filename.endswith(".gz"):
+        with gzip.open(filename, "rb") as f:
+            return f.read()
+    with open(filename, "rb") as f:
+        return f.read()
+
+
+# Shared async HTTP client so refreshes reuse one TCP/TLS connection
+# (with HTTP/2 multiplexing) instead of handshaking per fetch
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+# One lock per path so concurrent callers can't stampede the same refresh
+_refresh_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
-def refresh_html(path: str) -> None:
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared httpx.AsyncClient, creating it on first use.
+
+    The client keeps a small pool of keep-alive connections so back-to-back
+    refreshes reuse the same TLS connection, and retries transient connect
+    failures once before surfacing them.
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        # The transport carries the pool limits and retry policy; client-level
+        # settings would be ignored once an explicit transport is passed
+        transport = httpx.AsyncHTTPTransport(
+            http2 = True,
+            retries = 2,
+            limits = httpx.Limits(max_connections = 4, max_keepalive_connections = 4),
+        )
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout = 30,
+            follow_redirects = True,
+            transport = transport,
+        )
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared httpx.AsyncClient, if one was created.
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None and not _HTTP_CLIENT.is_closed:
+        await _HTTP_CLIENT.aclose()
+    _HTTP_CLIENT = None
+
+
+def _read_times_from_disk() -> Dict[str, str]:
+    """
+    Read the persisted refresh timestamps, falling back to the legacy
+    line-based last_updated.txt from older deployments.
+    """
+    if os.path.exists(LAST_UPDATED_FILE):
+        try:
+            with open(LAST_UPDATED_FILE, "r", encoding = "utf-8") as f:
+                return json.load(f)
+        except ValueError:
+            return {}
+
+    times = {}
+    if os.path.exists(LEGACY_LAST_UPDATED_FILE):
+        with open(LEGACY_LAST_UPDATED_FILE, "r", encoding = "utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and ":" in line:
+                    key, value = line.split(":", 1)
+                    times[key.strip()] = value.strip()
+    return times
+
+
+def _load_times() -> Dict[str, str]:
+    """
+    Return the in-memory timestamp dict, loading it from disk on first use.
+
+    The file's mtime is checked on every call (a single stat), so when
+    several worker processes share the file, an update written by one is
+    picked up by the others instead of each serving its own stale copy.
+    """
+    global _TIMES, _TIMES_MTIME
+    try:
+        mtime = os.stat(LAST_UPDATED_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    with _TIMES_LOCK:
+        if _TIMES is None or mtime != _TIMES_MTIME:
+            _TIMES = _read_times_from_disk()
+            _TIMES_MTIME = mtime
+        return _TIMES
+
+
+def _load_http_meta() -> Dict[str, Dict[str, str]]:
+    """
+    Load the stored HTTP cache validators, or an empty dict if none exist yet.
+    """
+    if os.path.exists(HTTP_META_FILE):
+        try:
+            with open(HTTP_META_FILE, "r", encoding = "utf-8") as f:
+                return json.load(f)
+        except ValueError:
+            return {}
+    return {}
+
+
+def _atomic_write_json(filename: str, data: Dict) -> None:
+    """
+    Write JSON to a file atomically via a temp file and os.replace, so a
+    concurrent reader never observes a half-written file.
+    """
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, "w", encoding = "utf-8") as f:
+        json.dump(data, f, indent = 2)
+    os.replace(tmp_filename, filename)
+
+
+def _save_http_meta(meta: Dict[str, Dict[str, str]]) -> None:
+    """
+    Persist the HTTP cache validators to the sidecar file.
+    """
+    _atomic_write_json(HTTP_META_FILE, meta)
+
+
+async def refresh_html(path: str) -> None:
     """
     Fetch HTML content from the Pasig City website and save it to a local file.
-    
+
+    The fetch goes through the shared async HTTP client, so it never blocks
+    the event loop and reuses the same connection across refreshes.
+
     Args:
         path: The data path (e.g., 'resolutions', 'ordinances', 'executive-orders', 'bids-and-awards').
               Must be a key in the path_to_url dictionary.
-    
+
     Returns:
         None
-    
+
     Side Effects:
         - Creates the 'htmls' directory if it doesn't exist
-        - Creates or overwrites the file 'htmls/{path}.html' with fetched content
+        - Creates or overwrites the file 'htmls/{path}.html.gz' with fetched
+          content (removing any plain 'htmls/{path}.html' it supersedes)
+        - Records the response's ETag / Last-Modified in 'http_meta.json';
+          when the upstream replies 304 Not Modified the file is left untouched
     """
     url = path_to_url[path]
-    html = requests.get(url)
-    
+
     # Create htmls folder if it doesn't exist
     os.makedirs("htmls", exist_ok = True)
-    
-    # Write the HTML content to file (creates new or replaces existing)
-    filename = os.path.join("htmls", f"{path}.html")
-    with open(filename, "w", encoding = "utf-8") as f:
-        f.write(html.text)
+    filename = os.path.join("htmls", f"{path}.html.gz")
+
+    # Send the validators from the previous fetch so an unchanged page
+    # costs a 304 round-trip instead of a full download
+    meta = _load_http_meta()
+    request_headers = {}
+    if html_cache_path(path) is not None:
+        cached = meta.get(path, {})
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+
+    # Stream the raw bytes straight to disk (creates new or replaces existing)
+    # instead of buffering the whole page and round-tripping it through str;
+    # the on-disk copy is gzipped, cutting its footprint roughly 10x. The
+    # download goes to a temp file swapped in with os.replace, so a reader
+    # parsing mid-refresh sees either the old file or the new one, never a
+    # truncated mix
+    tmp_filename = f"{filename}.tmp"
+    client = get_http_client()
+    try:
+        async with client.stream("GET", url, headers = request_headers) as response:
+            if response.status_code == 304:
+                # Upstream unchanged; keep the cached file as-is
+                return
+            response.raise_for_status()
+            with gzip.open(tmp_filename, "wb", compresslevel = 6) as f:
+                # aiter_bytes decompresses transfer-encoding transparently while streaming
+                async for chunk in response.aiter_bytes():
+                    f.write(chunk)
+    except BaseException:
+        # Don't leave a partial download behind on failure
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+    os.replace(tmp_filename, filename)
+
+    # Drop a superseded uncompressed copy so readers pick up the new file
+    plain_filename = os.path.join("htmls", f"{path}.html")
+    if os.path.exists(plain_filename):
+        os.remove(plain_filename)
+
+    # Remember the new validators for the next refresh. The sidecar is
+    # re-read under a lock with no awaits before the save, so concurrent
+    # refreshes of other paths can't clobber each other's entries with the
+    # pre-download snapshot read above
+    validators = {}
+    if response.headers.get("ETag"):
+        validators["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        validators["last_modified"] = response.headers["Last-Modified"]
+    with _HTTP_META_LOCK:
+        meta = _load_http_meta()
+        meta[path] = validators
+        _save_http_meta(meta)
 
 
 def update_time(path: str) -> None:
     """
     Update the last refresh timestamp for a specific data path in UTC+8.
-    
-    This function reads the existing timestamps from 'last_updated.txt', updates
-    the timestamp for the specified path with the current time, and writes all
-    timestamps back to the file.
-    
+
+    This function updates the in-memory timestamp for the specified path with
+    the current time and persists all timestamps to 'last_updated.json'.
+
     Args:
         path: The data path to update (e.g., 'resolutions', 'ordinances').
-    
+
     Returns:
         None
-    
+
     Side Effects:
-        - Creates or updates 'last_updated.txt' with the current timestamp
-        - Preserves timestamps for other paths in the file
+        - Creates or updates 'last_updated.json' with the current timestamp
+        - Preserves timestamps for other paths
     """
-    # Use UTC+8 timezone (Philippine Time)
-    utc_plus_8 = timezone(timedelta(hours = 8))
-    current_time = datetime.now(utc_plus_8).isoformat()
-    
-    # Read existing times
-    times = {}
-    if os.path.exists("last_updated.txt"):
-        with open("last_updated.txt", "r", encoding = "utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line and ":" in line:
-                    key, value = line.split(":", 1)
-                    times[key.strip()] = value.strip()
-    
-    # Update the time for the given path
-    times[path] = current_time
-    
-    # Write all times back to file
-    with open("last_updated.txt", "w", encoding = "utf-8") as f:
-        for key, value in times.items():
-            f.write(f"{key}: {value}\n")
+    current_time = datetime.now(PH_TZ).isoformat()
+
+    global _TIMES_MTIME
+    times = _load_times()
+    with _TIMES_LOCK:
+        times[path] = current_time
+        _atomic_write_json(LAST_UPDATED_FILE, times)
+        # Record the new mtime so our own write doesn't trigger a reload
+        _TIMES_MTIME = os.stat(LAST_UPDATED_FILE).st_mtime_ns
 
 
 def get_time(path: str) -> Optional[str]:
     """
     Retrieve the last refresh timestamp for a specific data path.
-    
+
     Args:
         path: The data path to look up (e.g., 'resolutions', 'ordinances').
-    
+
     Returns:
         The ISO-format timestamp string in UTC+8 if found, None otherwise.
-    
+
     Example:
         >>> get_time("resolutions")
         '2025-11-05T17:29:40.443171+08:00'
     """
-    with open("last_updated.txt", "r", encoding = "utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line and ":" in line:
-                key, value = line.split(":", 1)
-                if key.strip() == path:
-                    return value.strip()
-    return None
+    return _load_times().get(path)
+
+
+def _is_stale(path: str, refresh_timer: timedelta) -> bool:
+    """
+    Return True if the cached HTML for a path is due for a refresh.
+
+    A path with no recorded timestamp is always considered stale.
+    """
+    last_updated_str = get_time(path)
+    if last_updated_str is None:
+        return True
+
+    # Parse the last updated time
+    last_updated = datetime.fromisoformat(last_updated_str)
 
+    # Get current time in UTC+8
+    current_time = datetime.now(PH_TZ)
+
+    # Check if refresh is needed
+    return current_time - last_updated >= refresh_timer
 
-def update_if_needed(path: str, refresh_timer: timedelta = timedelta(days = 1)) -> None:
+
+async def update_if_needed(path: str, refresh_timer: timedelta = timedelta(days = 1)) -> None:
     """
     Refresh HTML content if the cached version is outdated.
-    
+
     This function checks the last update timestamp for the specified path and
     refreshes the HTML content if the time elapsed since the last update is
     greater than or equal to the refresh_timer. If no timestamp exists, it
-    refreshes immediately.
-    
+    refreshes immediately. A per-path lock with a double-check makes
+    concurrent callers wait for an in-flight refresh instead of downloading
+    the same page twice.
+
     Args:
         path: The data path to check and potentially refresh.
         refresh_timer: The minimum time between refreshes (default: 1 day).
-    
+
     Returns:
         None
-    
+
     Side Effects:
         - May fetch new HTML content and update the local cache
-        - May update the timestamp in 'last_updated.txt'
-    
+        - May update the timestamp in 'last_updated.json'
+
     Example:
         >>> # Refresh if older than 1 day (default)
-        >>> update_if_needed("resolutions")
-        >>> 
+        >>> await update_if_needed("resolutions")
+        >>>
         >>> # Refresh if older than 12 hours
-        >>> update_if_needed("ordinances", refresh_timer = timedelta(hours = 12))
+        >>> await update_if_needed("ordinances", refresh_timer = timedelta(hours = 12))
     """
-    # Get the last updated time for the path
-    last_updated_str = get_time(path)
-    
-    # If no record exists, refresh immediately
-    if last_updated_str is None:
-        refresh_html(path)
-        update_time(path)
+    # Cheap unlocked check first: the common case is a fresh cache
+    if not _is_stale(path, refresh_timer):
         return
-    
-    # Parse the last updated time
-    last_updated = datetime.fromisoformat(last_updated_str)
-    
-    # Get current time in UTC+8
-    utc_plus_8 = timezone(timedelta(hours = 8))
-    current_time = datetime.now(utc_plus_8)
-    
-    # Check if refresh is needed
-    time_difference = current_time - last_updated
-    
-    if time_difference >= refresh_timer:
-        refresh_html(path)
+
+    async with _refresh_locks[path]:
+        # Re-check inside the lock; a concurrent caller may have just
+        # finished this exact refresh
+        if not _is_stale(path, refresh_timer):
+            return
+        await refresh_html(path)
         update_time(path)
-    return
+
+
+async def refresh_all(refresh_timer: timedelta = timedelta(days = 1)) -> Dict[str, BaseException]:
+    """
+    Refresh every known data path concurrently.
+
+    The four upstream fetches are I/O-bound, so running them under
+    asyncio.gather overlaps the round-trips and the total wall time is
+    roughly that of the slowest fetch instead of their sum. Each path is
+    still guarded by its own single-flight lock.
+
+    Args:
+        refresh_timer: The minimum time between refreshes (default: 1 day).
+
+    Returns:
+        A dict mapping each path that failed to refresh to its exception;
+        empty when everything succeeded.
+    """
+    results = await asyncio.gather(
+        *(update_if_needed(path, refresh_timer) for path in path_to_url),
+        return_exceptions = True
+    )
+    return {path: result for path, result in zip(path_to_url, results) if isinstance(result, BaseException)}
 
 
 def get_current_year() -> int:
@@ -178,7 +428,4 @@ def get_current_year() -> int:
         >>> get_current_year()
         2025
     """
-    # Use UTC+8 timezone (Philippine Time)
-    utc_plus_8 = timezone(timedelta(hours = 8))
-    current_time = datetime.now(utc_plus_8)
-    return current_time.year
\ No newline at end of file
+    return datetime.now(PH_TZ).year
\ No newline at end of file